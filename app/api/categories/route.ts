@@ -1,10 +1,12 @@
 import { NextResponse } from 'next/server';
-import { getStarterCategories } from '@/lib/categoryStore';
+import { getStarterCategoriesJson } from '@/lib/categoryStore';
 
 export async function GET() {
   try {
-    const categories = getStarterCategories();
-    return NextResponse.json(categories);
+    // Serve the pre-serialized starter set directly; no per-request copy
+    return new NextResponse(getStarterCategoriesJson(), {
+      headers: { 'Content-Type': 'application/json' },
+    });
   } catch (error) {
     return NextResponse.json(
       { error: 'Failed to fetch starter categories' },
@@ -1,22 +1,37 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { generateExcelFile } from '@/lib/excelGenerator';
 import { applyCategoriesToData } from '@/lib/categoryMapper';
+import { getTransactionData, hashCategories } from '@/lib/resultCache';
 import { TransactionRow, Category } from '@/lib/types';
 
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
-    const { data, categories } = body;
+    const { data, data_token: dataToken, categories } = body;
 
-    if (!data || !Array.isArray(data) || data.length === 0) {
+    // Prefer the server-side cached result from upload; fall back to the
+    // row data sent by the client if the cache entry is gone.
+    const cachedResult = dataToken ? getTransactionData(dataToken) : null;
+
+    // Token miss with no fallback rows: tell the client distinctly so it
+    // can retry with the rows it holds instead of surfacing a hard error.
+    if (dataToken && !cachedResult && (!data || !Array.isArray(data) || data.length === 0)) {
+      return NextResponse.json(
+        { error: 'Upload session expired. Please upload the PDF again.', code: 'data_token_expired' },
+        { status: 410 }
+      );
+    }
+
+    const sourceData = cachedResult?.data ?? data;
+
+    if (!sourceData || !Array.isArray(sourceData) || sourceData.length === 0) {
       return NextResponse.json(
         { error: 'No transaction data found. Please upload a PDF first.' },
         { status: 400 }
       );
     }
-    console.log('data', data);
     // Convert data to TransactionRow format
-    const transactionData: TransactionRow[] = data.map((row: any) => ({
+    const transactionData: TransactionRow[] = sourceData.map((row: any) => ({
       TANGGAL: row.TANGGAL || '',
       KETERANGAN: row.KETERANGAN || '',
       'DETAIL TRANSAKSI': row['DETAIL TRANSAKSI'] || '',
@@ -25,9 +40,17 @@ export async function POST(request: NextRequest) {
       CATEGORY: row.CATEGORY,
     }));
 
-    // Apply categories if provided
+    // Apply categories if provided, unless the cached result was already
+    // categorized with the exact same config at upload time — categorization
+    // is deterministic, so re-running it would produce identical output.
     if (categories && Array.isArray(categories) && categories.length > 0) {
-      applyCategoriesToData(transactionData, categories as Category[]);
+      const alreadyApplied =
+        cachedResult?.categoriesHash != null &&
+        cachedResult.categoriesHash === hashCategories(categories as Category[]);
+
+      if (!alreadyApplied) {
+        applyCategoriesToData(transactionData, categories as Category[]);
+      }
     }
 
     // Generate Excel file
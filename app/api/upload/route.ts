@@ -1,8 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { extractTablesFromPdf, getExpectedColumns } from '@/lib/pdfParser';
-import { cleanTransactionData } from '@/lib/dataCleaner';
-import { applyCategoriesToData } from '@/lib/categoryMapper';
-import { Category, TransactionRow, PreviewData } from '@/lib/types';
+import { getExpectedColumns } from '@/lib/pdfParser';
+import { insertCategoryColumn } from '@/lib/dataCleaner';
+import { PdfPipelineError, processPdf } from '@/lib/pipeline';
+import { storeTransactionData } from '@/lib/resultCache';
+import { Category, TransactionRow } from '@/lib/types';
 
 export async function POST(request: NextRequest) {
   try {
@@ -28,84 +29,50 @@ export async function POST(request: NextRequest) {
     const arrayBuffer = await file.arrayBuffer();
     const pdfBuffer = Buffer.from(arrayBuffer);
 
-    // Extract tables from PDF
-    const rawRows = await extractTablesFromPdf(pdfBuffer);
-
-    // Debug: log first few raw rows to help diagnose parsing issues
-    console.log('[PDF Parser] Raw rows extracted:', rawRows.length);
-    rawRows.slice(0, 5).forEach((row, i) => {
-      console.log(`[PDF Parser] Row ${i}:`, JSON.stringify(row));
-    });
-
-    if (!rawRows || rawRows.length === 0) {
-      return NextResponse.json(
-        { error: 'No transaction tables found in the PDF. Please verify the file format.' },
-        { status: 400 }
-      );
-    }
-
-    // Clean the data
-    const cleanedData = cleanTransactionData(rawRows);
-
-    // Debug: log first few cleaned rows
-    console.log('[PDF Parser] Cleaned rows:', cleanedData.length);
-    cleanedData.slice(0, 5).forEach((row, i) => {
-      console.log(`[PDF Parser] Cleaned ${i}:`, JSON.stringify({
-        TANGGAL: row.TANGGAL,
-        KETERANGAN: row.KETERANGAN,
-        DETAIL: row["DETAIL TRANSAKSI"]?.substring(0, 50),
-        MUTASI: row.MUTASI,
-        SALDO: row.SALDO,
-      }));
-    });
-
-    if (cleanedData.length === 0) {
-      return NextResponse.json(
-        { error: 'No valid transaction data found after cleaning. Please verify the PDF format.' },
-        { status: 400 }
-      );
-    }
-
-    // Apply categories if provided
-    let categories: Category[] = [];
+    let categories: Category[] | null = null;
     if (categoriesJson) {
       try {
         categories = JSON.parse(categoriesJson);
-        applyCategoriesToData(cleanedData, categories);
       } catch (e) {
         console.warn('Could not apply categories:', e);
       }
     }
 
+    // Extract, clean and categorize via the shared pipeline
+    let result: { data: TransactionRow[]; categoriesHash: string | null };
+    try {
+      result = await processPdf(pdfBuffer, categories);
+    } catch (error) {
+      if (error instanceof PdfPipelineError) {
+        return NextResponse.json({ error: error.message }, { status: 400 });
+      }
+      throw error;
+    }
+    const { data: cleanedData, categoriesHash } = result;
+
     // Reorder columns to put CATEGORY after DETAIL TRANSAKSI if it exists
     const columns = getExpectedColumns();
     if (cleanedData.length > 0 && 'CATEGORY' in cleanedData[0]) {
-      const categoryIndex = columns.indexOf('DETAIL TRANSAKSI');
-      if (categoryIndex >= 0) {
-        columns.splice(categoryIndex + 1, 0, 'CATEGORY');
-      } else {
-        columns.push('CATEGORY');
-      }
+      insertCategoryColumn(columns);
     }
 
-    // Return preview data (first 100 rows for display)
-    const previewRows = cleanedData.slice(0, 100);
-    const previewData: PreviewData = {
+    // Cache the cleaned data server-side and hand the client a token; the
+    // download endpoint prefers the token over re-parsing the full row set
+    // from the request body. full_data stays in the response as a fallback
+    // for when the cache entry has expired (e.g. after a server restart).
+    const dataToken = storeTransactionData(cleanedData, categoriesHash);
+
+    // The preview rows are a prefix of full_data, so the client slices them
+    // out locally instead of the server serializing them twice.
+    return NextResponse.json({
       total_rows: cleanedData.length,
       columns: columns,
-      preview: previewRows,
       statistics: {
         total_transactions: cleanedData.length,
         columns_count: columns.length,
         has_date_range: cleanedData.some(row => row.TANGGAL && row.TANGGAL.trim() !== ''),
       },
-    };
-
-    // Store full data in response (we'll need it for download)
-    // In a real app, you might want to store this in a session or cache
-    // For now, we'll return it and the client will send it back for download
-    return NextResponse.json({
-      ...previewData,
+      data_token: dataToken,
       full_data: cleanedData, // Include full data for download
     });
   } catch (error) {
@@ -13,6 +13,7 @@ export default function Home() {
   const [isProcessing, setIsProcessing] = useState(false);
   const [previewData, setPreviewData] = useState<PreviewData | null>(null);
   const [fullData, setFullData] = useState<TransactionRow[] | null>(null);
+  const [dataToken, setDataToken] = useState<string | null>(null);
   const [error, setError] = useState<string | null>(null);
   const [isCategoryModalOpen, setIsCategoryModalOpen] = useState(false);
   const [isWelcomeDialogOpen, setIsWelcomeDialogOpen] = useState(false);
@@ -28,6 +29,7 @@ export default function Home() {
     setError(null);
     setPreviewData(null);
     setFullData(null);
+    setDataToken(null);
 
     try {
       const formData = new FormData();
@@ -44,12 +46,14 @@ export default function Home() {
       if (data.error) {
         setError(data.error);
       } else {
-        // Store full data for download
-        setFullData(data.full_data || data.preview);
+        // Store full data for download; the preview is its first 100 rows
+        const full: TransactionRow[] = data.full_data || data.preview || [];
+        setFullData(full);
+        setDataToken(data.data_token || null);
         setPreviewData({
           total_rows: data.total_rows,
           columns: data.columns,
-          preview: data.preview,
+          preview: data.preview || full.slice(0, 100),
           statistics: data.statistics,
         });
       }
@@ -67,16 +71,27 @@ export default function Home() {
     }
 
     try {
-      const response = await fetch('/api/download', {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-          data: fullData,
-          categories: categories,
-        }),
-      });
+      // With a valid token the server already holds the rows, so don't
+      // serialize the full statement back through the request body.
+      const requestDownload = (withData: boolean) =>
+        fetch('/api/download', {
+          method: 'POST',
+          headers: {
+            'Content-Type': 'application/json',
+          },
+          body: JSON.stringify(
+            withData
+              ? { data: fullData, categories: categories }
+              : { data_token: dataToken, categories: categories }
+          ),
+        });
+
+      let response = await requestDownload(!dataToken);
+
+      // Token expired server-side (410): retry once with the rows we hold
+      if (response.status === 410 && dataToken) {
+        response = await requestDownload(true);
+      }
 
       if (!response.ok) {
         const errorData = await response.json();
@@ -1,33 +1,69 @@
 'use client';
 
-import { useState, useEffect, useCallback } from 'react';
+import { useState, useEffect, useCallback, useMemo, useRef } from 'react';
 import { Category } from '@/lib/types';
 
 const LOCALSTORAGE_KEY = 'transaction_categories';
+const WRITE_DEBOUNCE_MS = 500;
+
+/** Single-pass shape check for a stored category list. */
+function isValidCategoryList(value: unknown): value is Category[] {
+  return (
+    Array.isArray(value) &&
+    value.every(
+      cat =>
+        !!cat &&
+        typeof cat === 'object' &&
+        typeof (cat as Category).category === 'string' &&
+        Array.isArray((cat as Category).keywords)
+    )
+  );
+}
 
 export function useCategories() {
   const [categories, setCategories] = useState<Category[]>([]);
   const [isLoading, setIsLoading] = useState(true);
 
+  // Lowercased name -> index, so case-insensitive lookups are O(1) hash
+  // probes instead of a linear scan that re-lowercases every stored name.
+  const nameIndex = useMemo(() => {
+    const index = new Map<string, number>();
+    categories.forEach((cat, i) => index.set(cat.category.toLowerCase(), i));
+    return index;
+  }, [categories]);
+
   // Load categories from localStorage or fetch starter categories
   useEffect(() => {
     const loadCategories = async () => {
       try {
         const stored = localStorage.getItem(LOCALSTORAGE_KEY);
         if (stored) {
-          const parsed = JSON.parse(stored);
-          setCategories(parsed);
-          setIsLoading(false);
-        } else {
-          // Fetch starter categories from server
-          const response = await fetch('/api/categories');
-          if (response.ok) {
-            const starterCategories = await response.json();
-            setCategories(starterCategories);
-            localStorage.setItem(LOCALSTORAGE_KEY, JSON.stringify(starterCategories));
+          try {
+            const parsed = JSON.parse(stored);
+            if (isValidCategoryList(parsed)) {
+              setCategories(parsed);
+              setIsLoading(false);
+              return;
+            }
+            // Parseable but wrong shape — treat like corruption below
+            console.error('Stored categories have an unexpected shape, resetting');
+          } catch (parseError) {
+            // Corrupted entry (e.g. manual edit or interrupted write):
+            // fall through and re-seed from the server instead of leaving
+            // the user with no categories at all.
+            console.error('Stored categories are corrupted, resetting:', parseError);
           }
-          setIsLoading(false);
         }
+
+        // Fetch starter categories from server; keep the raw JSON text so
+        // it can go straight into localStorage without re-serializing
+        const response = await fetch('/api/categories');
+        if (response.ok) {
+          const raw = await response.text();
+          setCategories(JSON.parse(raw));
+          localStorage.setItem(LOCALSTORAGE_KEY, raw);
+        }
+        setIsLoading(false);
       } catch (error) {
         console.error('Error loading categories:', error);
         setIsLoading(false);
@@ -37,14 +73,45 @@ export function useCategories() {
     loadCategories();
   }, []);
 
+  // Pending (not yet persisted) categories and the debounce timer
+  const pendingRef = useRef<Category[] | null>(null);
+  const timerRef = useRef<ReturnType<typeof setTimeout> | null>(null);
+
+  const flushCategories = useCallback(() => {
+    if (timerRef.current !== null) {
+      clearTimeout(timerRef.current);
+      timerRef.current = null;
+    }
+    if (pendingRef.current !== null) {
+      localStorage.setItem(LOCALSTORAGE_KEY, JSON.stringify(pendingRef.current));
+      pendingRef.current = null;
+    }
+  }, []);
+
+  // Persist any pending write when the component unmounts or the page is
+  // being hidden/closed, so the debounce can't drop the last mutation.
+  useEffect(() => {
+    window.addEventListener('pagehide', flushCategories);
+    return () => {
+      window.removeEventListener('pagehide', flushCategories);
+      flushCategories();
+    };
+  }, [flushCategories]);
+
   const saveCategories = useCallback((newCategories: Category[]) => {
     setCategories(newCategories);
-    localStorage.setItem(LOCALSTORAGE_KEY, JSON.stringify(newCategories));
-  }, []);
+    // Coalesce rapid successive mutations (e.g. bulk edits in the modal)
+    // into a single serialization + localStorage write.
+    pendingRef.current = newCategories;
+    if (timerRef.current !== null) {
+      clearTimeout(timerRef.current);
+    }
+    timerRef.current = setTimeout(flushCategories, WRITE_DEBOUNCE_MS);
+  }, [flushCategories]);
 
   const addCategory = useCallback((name: string, keywords: string): boolean => {
     const nameLower = name.trim().toLowerCase();
-    if (categories.some(cat => cat.category.toLowerCase() === nameLower)) {
+    if (nameIndex.has(nameLower)) {
       return false; // Category already exists
     }
 
@@ -67,18 +134,18 @@ export function useCategories() {
 
     saveCategories(newCategories);
     return true;
-  }, [categories, saveCategories]);
+  }, [categories, nameIndex, saveCategories]);
 
   const updateCategory = useCallback((oldName: string, newName: string | null, keywords: string | null): boolean => {
-    const categoryIndex = categories.findIndex(
-      cat => cat.category.toLowerCase() === oldName.toLowerCase()
-    );
+    const categoryIndex = nameIndex.get(oldName.toLowerCase()) ?? -1;
 
     if (categoryIndex === -1) {
       return false; // Category not found
     }
 
-    const newCategories = [...categories];
+    const current = categories[categoryIndex];
+    let nextName = current.category;
+    let nextKeywords = current.keywords;
 
     // Validate new name if provided
     if (newName !== null && newName !== undefined) {
@@ -89,13 +156,12 @@ export function useCategories() {
 
       // Check if new name conflicts with existing category
       const newNameLower = newNameTrimmed.toLowerCase();
-      if (categories.some((cat, idx) =>
-        idx !== categoryIndex && cat.category.toLowerCase() === newNameLower
-      )) {
+      const existingIndex = nameIndex.get(newNameLower);
+      if (existingIndex !== undefined && existingIndex !== categoryIndex) {
         return false; // New name already exists
       }
 
-      newCategories[categoryIndex].category = newNameTrimmed;
+      nextName = newNameTrimmed;
     }
 
     // Update keywords if provided
@@ -109,25 +175,40 @@ export function useCategories() {
         throw new Error('At least one keyword is required');
       }
 
-      newCategories[categoryIndex].keywords = cleanedKeywords;
+      nextKeywords = cleanedKeywords;
     }
 
+    // Skip the state update and localStorage write when nothing changed
+    // (redundant saves from the modal are common).
+    const keywordsChanged =
+      nextKeywords !== current.keywords &&
+      (nextKeywords.length !== current.keywords.length ||
+        nextKeywords.some((keyword, i) => keyword !== current.keywords[i]));
+
+    if (nextName === current.category && !keywordsChanged) {
+      return true;
+    }
+
+    const newCategories = categories.slice();
+    newCategories[categoryIndex] = {
+      category: nextName,
+      keywords: keywordsChanged ? nextKeywords : current.keywords,
+    };
     saveCategories(newCategories);
     return true;
-  }, [categories, saveCategories]);
+  }, [categories, nameIndex, saveCategories]);
 
   const deleteCategory = useCallback((name: string): boolean => {
-    const newCategories = categories.filter(
-      cat => cat.category.toLowerCase() !== name.toLowerCase()
-    );
-
-    if (newCategories.length === categories.length) {
+    const index = nameIndex.get(name.toLowerCase());
+    if (index === undefined) {
       return false; // Category not found
     }
 
+    const newCategories = categories.slice();
+    newCategories.splice(index, 1);
     saveCategories(newCategories);
     return true;
-  }, [categories, saveCategories]);
+  }, [categories, nameIndex, saveCategories]);
 
   return {
     categories,
@@ -1,8 +1,95 @@
 import { Category, TransactionRow } from './types';
 
+/** Characters that must be escaped before embedding a keyword in a RegExp. */
+const RE_ESCAPE = /[.*+?^${}()|[\]\\]/g;
+
+/** Max number of distinct category configs whose compiled matchers we keep. */
+const MATCHER_CACHE_SIZE = 32;
+
+const matcherCache = new Map<string, CompiledMatcher | null>();
+const patternCache = new Map<string, Array<{ name: string; pattern: RegExp }>>();
+
+/**
+ * Stable cache key for a category config: category names plus keyword lists
+ * in order. Two configs with the same key compile to the same matcher.
+ */
+function configKey(categoryConfig: Category[]): string {
+  return JSON.stringify(
+    categoryConfig.map(catDict => [catDict.category || '', catDict.keywords || []])
+  );
+}
+
+/**
+ * Memoize a compiled matcher in a small LRU cache so repeated requests with
+ * the same category config (the common case: one config per user) skip the
+ * compile step entirely.
+ */
+function getCached<T>(cache: Map<string, T>, key: string, build: () => T): T {
+  if (cache.has(key)) {
+    const value = cache.get(key) as T;
+    // Re-insert to refresh LRU order (Maps iterate in insertion order).
+    cache.delete(key);
+    cache.set(key, value);
+    return value;
+  }
+
+  const value = build();
+  cache.set(key, value);
+  if (cache.size > MATCHER_CACHE_SIZE) {
+    cache.delete(cache.keys().next().value as string);
+  }
+  return value;
+}
+
+/**
+ * Compile one alternation regex per category from its keywords.
+ *
+ * Keywords are lowercased/trimmed and regex-escaped; categories with no
+ * usable keywords are skipped. Order is preserved so testing the patterns
+ * in sequence keeps first-match-wins semantics.
+ */
+function buildCategoryPatterns(
+  categoryConfig: Category[]
+): Array<{ name: string; pattern: RegExp; minLength: number }> {
+  const compiled: Array<{ name: string; pattern: RegExp; minLength: number }> = [];
+
+  for (const catDict of categoryConfig) {
+    const categoryName = catDict.category || '';
+    const keywords = catDict.keywords || [];
+
+    if (!categoryName || keywords.length === 0) {
+      continue;
+    }
+
+    // Longest keywords first: the regex engine tries alternatives in order,
+    // so the most specific keyword wins when several share a prefix (e.g.
+    // "gopay topup" before "gopay"). The category result is unchanged —
+    // every alternative maps to the same name — but match behaviour is
+    // deterministic and specificity-first.
+    const cleaned = keywords
+      .map(keyword => String(keyword).toLowerCase().trim())
+      .filter(keyword => keyword.length > 0)
+      .sort((a, b) => b.length - a.length);
+
+    if (cleaned.length === 0) {
+      continue;
+    }
+
+    const parts = cleaned.map(keyword => keyword.replace(RE_ESCAPE, '\\$&'));
+    compiled.push({
+      name: categoryName,
+      pattern: new RegExp(parts.join('|')),
+      // Sorted longest-first, so the last entry is the shortest keyword
+      minLength: cleaned[cleaned.length - 1].length,
+    });
+  }
+
+  return compiled;
+}
+
 /**
  * Map a transaction description to a category based on keyword matching.
- * 
+ *
  * Matching rules:
  * - Case-insensitive substring matching
  * - First match wins (based on config order)
@@ -23,7 +110,97 @@ export function mapCategory(
     return "Uncategorized";
   }
 
-  // Iterate through categories in order (first match wins)
+  // One native regex scan per category instead of a per-keyword loop;
+  // category order decides ties, as before.
+  const patterns = getCached(patternCache, configKey(categoryConfig), () =>
+    buildCategoryPatterns(categoryConfig)
+  );
+  for (const { name, pattern, minLength } of patterns) {
+    // Skip categories whose shortest keyword can't fit in the description
+    if (descriptionLower.length >= minLength && pattern.test(descriptionLower)) {
+      return name;
+    }
+  }
+
+  // No match found
+  return "Uncategorized";
+}
+
+/**
+ * Find every category whose keywords match a description (not just the
+ * first). Useful for tooling that wants to surface overlapping categories.
+ *
+ * Returns category names in config order; empty array when nothing matches.
+ */
+export function matchCategories(
+  description: string | null | undefined,
+  categoryConfig: Category[]
+): string[] {
+  if (!description) {
+    return [];
+  }
+
+  const descriptionLower = String(description).toLowerCase().trim();
+  if (!descriptionLower) {
+    return [];
+  }
+
+  const patterns = getCached(patternCache, configKey(categoryConfig), () =>
+    buildCategoryPatterns(categoryConfig)
+  );
+
+  const matches: string[] = [];
+  for (const { name, pattern, minLength } of patterns) {
+    if (descriptionLower.length >= minLength && pattern.test(descriptionLower)) {
+      matches.push(name);
+    }
+  }
+  return matches;
+}
+
+/**
+ * Compiled Aho-Corasick automaton over all keywords in a category config.
+ *
+ * Nodes are stored as parallel arrays: `transitions[node]` maps a character
+ * code to the next node, `failLinks[node]` is the longest proper suffix state,
+ * and `bestCat`/`bestKw` record the highest-priority keyword (lowest category
+ * index, then lowest keyword index) that ends at the node or any of its
+ * suffix states.
+ */
+interface CompiledMatcher {
+  categoryNames: string[];
+  transitions: Array<Map<number, number>>;
+  failLinks: number[];
+  bestCat: number[];
+  bestKw: number[];
+  /** Length of the shortest keyword; shorter descriptions can't match. */
+  minKeywordLength: number;
+}
+
+/**
+ * Build an Aho-Corasick automaton from a category config.
+ *
+ * Keywords are lowercased/trimmed once here, so scanning does no per-keyword
+ * string work. Returns null when the config contains no usable keywords.
+ */
+function buildMatcher(categoryConfig: Category[]): CompiledMatcher | null {
+  const categoryNames: string[] = [];
+  const transitions: Array<Map<number, number>> = [new Map()];
+  const failLinks: number[] = [0];
+  const bestCat: number[] = [-1];
+  const bestKw: number[] = [-1];
+
+  const newNode = (): number => {
+    transitions.push(new Map());
+    failLinks.push(0);
+    bestCat.push(-1);
+    bestKw.push(-1);
+    return transitions.length - 1;
+  };
+
+  let hasKeywords = false;
+  let minKeywordLength = Infinity;
+
   for (const catDict of categoryConfig) {
     const categoryName = catDict.category || '';
     const keywords = catDict.keywords || [];
@@ -32,22 +209,124 @@ export function mapCategory(
       continue;
     }
 
-    // Check if any keyword matches (case-insensitive substring search)
-    for (const keyword of keywords) {
-      const keywordLower = String(keyword).toLowerCase().trim();
-      if (keywordLower && descriptionLower.includes(keywordLower)) {
-        return categoryName;
+    const catIndex = categoryNames.length;
+    categoryNames.push(categoryName);
+
+    for (let keywordIndex = 0; keywordIndex < keywords.length; keywordIndex++) {
+      const keywordLower = String(keywords[keywordIndex]).toLowerCase().trim();
+      if (!keywordLower) {
+        continue;
+      }
+      hasKeywords = true;
+      if (keywordLower.length < minKeywordLength) {
+        minKeywordLength = keywordLower.length;
+      }
+
+      let node = 0;
+      for (let i = 0; i < keywordLower.length; i++) {
+        const code = keywordLower.charCodeAt(i);
+        let child = transitions[node].get(code);
+        if (child === undefined) {
+          child = newNode();
+          transitions[node].set(code, child);
+        }
+        node = child;
+      }
+
+      if (
+        bestCat[node] === -1 ||
+        catIndex < bestCat[node] ||
+        (catIndex === bestCat[node] && keywordIndex < bestKw[node])
+      ) {
+        bestCat[node] = catIndex;
+        bestKw[node] = keywordIndex;
       }
     }
   }
 
-  // No match found
-  return "Uncategorized";
+  if (!hasKeywords) {
+    return null;
+  }
+
+  // BFS to compute failure links; fold each node's suffix matches into it so
+  // scanning only ever inspects the current state.
+  const queue: number[] = [];
+  for (const child of transitions[0].values()) {
+    queue.push(child);
+  }
+
+  for (let head = 0; head < queue.length; head++) {
+    const node = queue[head];
+    const fail = failLinks[node];
+
+    if (
+      bestCat[fail] !== -1 &&
+      (bestCat[node] === -1 ||
+        bestCat[fail] < bestCat[node] ||
+        (bestCat[fail] === bestCat[node] && bestKw[fail] < bestKw[node]))
+    ) {
+      bestCat[node] = bestCat[fail];
+      bestKw[node] = bestKw[fail];
+    }
+
+    for (const [code, child] of transitions[node]) {
+      let f = failLinks[node];
+      let target = transitions[f].get(code);
+      while (target === undefined && f !== 0) {
+        f = failLinks[f];
+        target = transitions[f].get(code);
+      }
+      failLinks[child] = target ?? 0;
+      queue.push(child);
+    }
+  }
+
+  return { categoryNames, transitions, failLinks, bestCat, bestKw, minKeywordLength };
+}
+
+/**
+ * Scan a lowercased description in a single pass and return the matching
+ * category index (or -1 if no keyword matched).
+ */
+function scanDescription(matcher: CompiledMatcher, descriptionLower: string): number {
+  const { transitions, failLinks, bestCat, bestKw } = matcher;
+  let state = 0;
+  let matchCat = -1;
+  let matchKw = -1;
+
+  for (let i = 0; i < descriptionLower.length; i++) {
+    const code = descriptionLower.charCodeAt(i);
+
+    // One map lookup per step: probe, and only walk fail links on a miss.
+    let next = transitions[state].get(code);
+    while (next === undefined && state !== 0) {
+      state = failLinks[state];
+      next = transitions[state].get(code);
+    }
+    state = next ?? 0;
+
+    const cat = bestCat[state];
+    if (
+      cat !== -1 &&
+      (matchCat === -1 || cat < matchCat || (cat === matchCat && bestKw[state] < matchKw))
+    ) {
+      matchCat = cat;
+      matchKw = bestKw[state];
+      if (matchCat === 0 && matchKw === 0) {
+        // Nothing can outrank the very first keyword of the first category.
+        break;
+      }
+    }
+  }
+
+  return matchCat;
 }
 
 /**
  * Apply category mapping to transaction data by adding/updating a CATEGORY column.
- * 
+ *
+ * Builds the keyword automaton once per call and scans each description in a
+ * single pass, so cost scales with text length rather than keyword count.
  * This function modifies the data in-place.
  */
 export function applyCategoriesToData(
@@ -59,9 +338,37 @@ export function applyCategoriesToData(
     return;
   }
 
-  // Apply category mapping to each row
+  const matcher = getCached(matcherCache, configKey(categoryConfig), () =>
+    buildMatcher(categoryConfig)
+  );
+
+  if (!matcher) {
+    for (const row of data) {
+      row.CATEGORY = "Uncategorized";
+    }
+    return;
+  }
+
+  // Apply category mapping to each row. Statements repeat the same
+  // merchants a lot, so scan each distinct description only once and reuse
+  // the result for duplicates.
+  const resolved = new Map<string, string>();
+
   for (const row of data) {
     const description = row[descriptionColumn] as string | undefined;
-    row.CATEGORY = mapCategory(description, categoryConfig);
+    const descriptionLower = description ? String(description).toLowerCase().trim() : '';
+
+    let category = resolved.get(descriptionLower);
+    if (category === undefined) {
+      // Descriptions shorter than the shortest keyword can't match anything
+      const catIndex =
+        descriptionLower.length >= matcher.minKeywordLength
+          ? scanDescription(matcher, descriptionLower)
+          : -1;
+      category = catIndex === -1 ? "Uncategorized" : matcher.categoryNames[catIndex];
+      resolved.set(descriptionLower, category);
+    }
+
+    row.CATEGORY = category;
   }
 }
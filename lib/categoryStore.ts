@@ -83,9 +83,30 @@ export const STARTER_CATEGORIES: Category[] = [
   }
 ];
 
+// The starter set is shared, canonical data: freeze it (including the
+// nested keyword arrays) so no caller can mutate it in place. Anyone who
+// needs a mutable copy goes through getStarterCategories().
+STARTER_CATEGORIES.forEach(cat => {
+  Object.freeze(cat.keywords);
+  Object.freeze(cat);
+});
+Object.freeze(STARTER_CATEGORIES);
+
+// Serialized once at module load; the starter set never changes at runtime,
+// so per-request serialization is wasted work.
+const STARTER_CATEGORIES_JSON = JSON.stringify(STARTER_CATEGORIES);
+
 /**
- * Get the default starter categories.
+ * Get the default starter categories as a fresh mutable copy.
  */
 export function getStarterCategories(): Category[] {
-  return JSON.parse(JSON.stringify(STARTER_CATEGORIES));
+  return JSON.parse(STARTER_CATEGORIES_JSON);
+}
+
+/**
+ * Get the starter categories pre-serialized as JSON, for handlers that
+ * would otherwise copy and immediately re-stringify them.
+ */
+export function getStarterCategoriesJson(): string {
+  return STARTER_CATEGORIES_JSON;
 }
@@ -1,6 +1,129 @@
 import { TransactionRow } from './types';
 
 const EXPECTED_COLUMNS = ["TANGGAL", "KETERANGAN", "DETAIL TRANSAKSI", "MUTASI", "SALDO"];
+const COLUMN_COUNT = EXPECTED_COLUMNS.length;
+
+// Regexes compiled once at module load. These run once per cell or row, so
+// hot paths shouldn't re-create RegExp objects from literals on every call.
+const RE_DBCR_WORD = /\b(DB|CR|DEBIT|CREDIT)\b/i;
+const RE_THOUSAND_SEP = /\d{1,3}(?:[,\.]\d{3})+(?:[,\.]\d{2})?/;
+const RE_TWO_DECIMALS = /\.\d{2,}/;
+const RE_DBCR = /(DB|CR)/i;
+// Anchored: a transaction date sits at the start of the (trimmed) TANGGAL
+// cell, so the engine can reject non-date rows without scanning the string.
+const RE_DATE_DDMM_START = /^\d{1,2}\/\d{1,2}/;
+const RE_MULTI_SPACE = /\s{2,}/g;
+const RE_CURRENCY_PREFIX = /[Rr][Pp]\s*|[$€£¥]/g;
+const RE_DBCR_END = /\s*(DB|CR|DEBIT|CREDIT)\s*$/gi;
+const RE_DBCR_MID = /\s*(DB|CR|DEBIT|CREDIT)\s*/gi;
+const RE_NON_DIGIT = /[^\d]/g;
+const RE_NON_NUMERIC_DOT = /[^\d.]/g;
+// Matches thousand-separated, decimal or large plain amounts, optionally
+// suffixed with DB/CR. Global flag: lastIndex must be reset before exec loops.
+const RE_CURRENCY_VALUE = /(\d{1,3}(?:[,\.]\d{3})*(?:[,\.]\d{2})?(?:\s*(?:DB|CR))?|\d+\.\d{2,}(?:\s*(?:DB|CR))?|\d{4,}(?:\s*(?:DB|CR))?)/g;
+
+/**
+ * Get the expected column names for bank transaction tables.
+ */
+export function getExpectedColumns(): string[] {
+  return [...EXPECTED_COLUMNS];
+}
+
+/**
+ * Insert CATEGORY directly after DETAIL TRANSAKSI, mutating the column list
+ * in place instead of rebuilding it. No-op if CATEGORY is already present.
+ */
+export function insertCategoryColumn(columns: string[]): string[] {
+  if (columns.includes('CATEGORY')) {
+    return columns;
+  }
+
+  const detailIndex = columns.indexOf('DETAIL TRANSAKSI');
+  if (detailIndex >= 0) {
+    columns.splice(detailIndex + 1, 0, 'CATEGORY');
+  } else {
+    columns.push('CATEGORY');
+  }
+  return columns;
+}
+
+/**
+ * Normalize thousand/decimal separators and drop non-numeric characters in
+ * a single scan, returning a string parseFloat understands.
+ *
+ * Implements the same disambiguation as the old multi-pass version:
+ * - comma and dot both present (BCA format "98,779,762.35"): commas are
+ *   thousand separators, drop them and keep dots
+ * - commas only: the first comma is the decimal separator when it is
+ *   followed by at most two characters or there are several commas
+ *   (Indonesian format), otherwise a thousand separator
+ * - dots only: multiple dots are thousand separators, a single dot is the
+ *   decimal separator
+ */
+function normalizeSeparators(valueStr: string): string {
+  // First scan: count separators and remember the first comma
+  let commaCount = 0;
+  let dotCount = 0;
+  let firstComma = -1;
+  for (let i = 0; i < valueStr.length; i++) {
+    const code = valueStr.charCodeAt(i);
+    if (code === 0x2c /* ',' */) {
+      commaCount++;
+      if (firstComma === -1) {
+        firstComma = i;
+      }
+    } else if (code === 0x2e /* '.' */) {
+      dotCount++;
+    }
+  }
+
+  // Decide which separator (if any) becomes the decimal point
+  let decimalCommaIndex = -1;
+  let keepDots = true;
+  if (commaCount > 0 && dotCount > 0) {
+    // Comma is a thousand separator, dot the decimal point
+  } else if (commaCount > 0) {
+    const digitsAfterComma = valueStr.length - firstComma - 1;
+    if (commaCount > 1 || digitsAfterComma <= 2) {
+      decimalCommaIndex = firstComma;
+      keepDots = false;
+    }
+  } else if (dotCount > 1) {
+    keepDots = false;
+  }
+
+  // Second scan: emit digits, the minus sign and the chosen decimal point
+  let out = '';
+  for (let i = 0; i < valueStr.length; i++) {
+    const code = valueStr.charCodeAt(i);
+    if ((code >= 0x30 && code <= 0x39) || code === 0x2d /* '-' */) {
+      out += valueStr[i];
+    } else if (code === 0x2c) {
+      if (i === decimalCommaIndex) {
+        out += '.';
+      }
+    } else if (code === 0x2e && keepDots) {
+      out += '.';
+    }
+  }
+  return out;
+}
+
+/**
+ * Return a copy of a row padded to the expected column count.
+ * Allocates the target-size array once instead of growing it push by push.
+ */
+function padRow(row: any[], fill: any = ''): any[] {
+  if (row.length >= COLUMN_COUNT) {
+    return row.slice();
+  }
+
+  const padded = new Array(COLUMN_COUNT).fill(fill);
+  for (let i = 0; i < row.length; i++) {
+    padded[i] = row[i];
+  }
+  return padded;
+}
 
 /**
  * Check if a number string looks like a currency value.
@@ -18,20 +141,20 @@ export function isCurrencyValue(value: string): boolean {
   const trimmed = value.trim();
   
   // Check for DB/CR indicators - these are strong signals of currency
-  if (/\b(DB|CR|DEBIT|CREDIT)\b/i.test(trimmed)) {
+  if (RE_DBCR_WORD.test(trimmed)) {
     return true;
   }
 
   // Check for thousand separators (commas or dots in number pattern)
   // Pattern: digits, then comma/dot, then 3 digits (repeated), optionally followed by decimal
-  if (/\d{1,3}(?:[,\.]\d{3})+(?:[,\.]\d{2})?/.test(trimmed)) {
+  if (RE_THOUSAND_SEP.test(trimmed)) {
     return true;
   }
 
   // Check for decimal places (at least 2 digits after decimal)
-  if (/\.\d{2,}/.test(trimmed)) {
+  if (RE_TWO_DECIMALS.test(trimmed)) {
     // Extract numeric value to check if it's substantial
-    const numericPart = trimmed.replace(/[^\d.]/g, '');
+    const numericPart = trimmed.replace(RE_NON_NUMERIC_DOT, '');
     const numValue = parseFloat(numericPart);
     if (!isNaN(numValue) && numValue >= 1) {
       return true;
@@ -39,7 +162,7 @@ export function isCurrencyValue(value: string): boolean {
   }
 
   // Check if it's a large number without decimals (>= 1000)
-  const numericPart = trimmed.replace(/[^\d]/g, '');
+  const numericPart = trimmed.replace(RE_NON_DIGIT, '');
   const numValue = parseFloat(numericPart);
   if (!isNaN(numValue) && numValue >= 1000) {
     return true;
@@ -61,18 +184,12 @@ export function extractCurrencyValues(line: string): { mutasi: string; saldo: st
     return { mutasi, saldo, remainingLine };
   }
 
-  // Pattern to match currency values:
-  // - Numbers with thousand separators: 23,000.00 or 111,686,562.71
-  // - Numbers with DB/CR: 23,000.00 DB or 23,000.00DB
-  // - Numbers with decimals: 23.50 or 111686562.71
-  // - Large numbers: 1000 or more
-  const currencyPattern = /(\d{1,3}(?:[,\.]\d{3})*(?:[,\.]\d{2})?(?:\s*(?:DB|CR))?|\d+\.\d{2,}(?:\s*(?:DB|CR))?|\d{4,}(?:\s*(?:DB|CR))?)/g;
-  
   const matches: Array<{ value: string; index: number; length: number }> = [];
   let match;
-  
-  // Find all potential currency matches
-  while ((match = currencyPattern.exec(line)) !== null) {
+
+  // Find all potential currency matches (shared pattern: reset lastIndex first)
+  RE_CURRENCY_VALUE.lastIndex = 0;
+  while ((match = RE_CURRENCY_VALUE.exec(line)) !== null) {
     const value = match[1].trim();
     // Filter to only include values that look like currency
     if (isCurrencyValue(value)) {
@@ -81,13 +198,13 @@ export function extractCurrencyValues(line: string): { mutasi: string; saldo: st
   }
 
   // Helper: value has DB/CR suffix (transaction amount indicator)
-  const hasDbCr = (v: string) => /(DB|CR)/i.test(v);
+  const hasDbCr = (v: string) => RE_DBCR.test(v);
   // Helper: value looks like running balance (large, no DB/CR - typically 7+ digits)
   const looksLikeBalance = (v: string) => {
-    const num = parseFloat(String(v).replace(/[^\d.]/g, ''));
+    const num = parseFloat(String(v).replace(RE_NON_NUMERIC_DOT, ''));
     return !isNaN(num) && num >= 1_000_000 && !hasDbCr(v);
   };
-  const toNum = (v: string) => parseFloat(String(v).replace(/[^\d.]/g, '')) || 0;
+  const toNum = (v: string) => parseFloat(String(v).replace(RE_NON_NUMERIC_DOT, '')) || 0;
   const sameAmount = (a: string, b: string) => Math.abs(toNum(a) - toNum(b)) < 0.01;
 
   // Extract the last two currency values (MUTASI and SALDO)
@@ -130,7 +247,7 @@ export function extractCurrencyValues(line: string): { mutasi: string; saldo: st
       parts.push(line.substring(lastIndex));
     }
     
-    remainingLine = parts.join('').replace(/\s{2,}/g, ' ').trim();
+    remainingLine = parts.join('').replace(RE_MULTI_SPACE, ' ').trim();
   } else if (matches.length === 1) {
     // Only one currency value - use heuristics: DB/CR = MUTASI, large balance = SALDO
     const singleMatch = matches[0];
@@ -145,7 +262,7 @@ export function extractCurrencyValues(line: string): { mutasi: string; saldo: st
     remainingLine = (
       line.substring(0, singleMatch.index) + 
       line.substring(singleMatch.index + singleMatch.length)
-    ).replace(/\s{2,}/g, ' ').trim();
+    ).replace(RE_MULTI_SPACE, ' ').trim();
   }
 
   return { mutasi, saldo, remainingLine };
@@ -161,6 +278,11 @@ export function cleanCurrencyValue(value: any): number | null {
     return null;
   }
 
+  // Fast path: already-numeric cells need no string work at all
+  if (typeof value === 'number') {
+    return Number.isFinite(value) ? value : null;
+  }
+
   // Convert to string
   let valueStr = String(value).trim();
 
@@ -168,59 +290,18 @@ export function cleanCurrencyValue(value: any): number | null {
     return null;
   }
 
-  // Remove currency symbols (Rp, $, etc.)
-  valueStr = valueStr.replace(/[Rr][Pp]\s*/g, '');
-  valueStr = valueStr.replace(/[$€£¥]/g, '');
+  // Remove currency symbols (Rp, $, etc.) in a single pass
+  valueStr = valueStr.replace(RE_CURRENCY_PREFIX, '');
 
   // Remove DB/CR indicators (Debit/Credit indicators)
-  valueStr = valueStr.replace(/\s*(DB|CR|DEBIT|CREDIT)\s*$/gi, '');
-  valueStr = valueStr.replace(/\s*(DB|CR|DEBIT|CREDIT)\s*/gi, ' ');
-
-  // Handle BCA format: numbers like "98,779,762.35" or "23,400.00"
-  // Check if it uses comma as thousand separator and dot as decimal
-  if (valueStr.includes(',') && valueStr.includes('.')) {
-    // Format like "98,779,762.35" - comma is thousand separator, dot is decimal
-    // Remove commas, keep dot
-    valueStr = valueStr.replace(/,/g, '');
-  } else if (valueStr.includes(',')) {
-    // Only comma present - could be decimal separator (Indonesian format) or thousand
-    // Check if there are multiple commas (thousand separators)
-    const commaCount = (valueStr.match(/,/g) || []).length;
-    const parts = valueStr.split(',');
-    if (commaCount > 1 || (commaCount === 1 && parts[1] && parts[1].length <= 2)) {
-      // Likely decimal separator (e.g., "1.000.000,50")
-      // First remove dots (thousand separators), then replace comma with dot
-      valueStr = valueStr.replace(/\./g, '');
-      valueStr = valueStr.replace(',', '.');
-    } else {
-      // Single comma, might be thousand separator or decimal
-      // If digits after comma <= 2, it's likely decimal separator
-      if (parts.length === 2 && parts[1].length <= 2) {
-        valueStr = parts[0].replace(/\./g, '') + '.' + parts[1];
-      } else {
-        // Treat as thousand separator
-        valueStr = valueStr.replace(/,/g, '');
-      }
-    }
-  } else {
-    // Only dots - could be thousand separators (Indonesian format)
-    // If there are multiple dots, they're thousand separators
-    const dotCount = (valueStr.match(/\./g) || []).length;
-    if (dotCount > 1) {
-      // Multiple dots = thousand separators, remove them
-      valueStr = valueStr.replace(/\./g, '');
-    }
-    // If single dot, keep it as decimal separator
-  }
+  valueStr = valueStr.replace(RE_DBCR_END, '');
+  valueStr = valueStr.replace(RE_DBCR_MID, ' ');
 
-  // Remove any remaining non-numeric characters except decimal point and minus sign
-  valueStr = valueStr.replace(/[^\d.\-]/g, '');
+  // Disambiguate thousand/decimal separators and strip everything
+  // non-numeric in one pass over the characters
+  valueStr = normalizeSeparators(valueStr);
 
-  try {
-    return valueStr ? parseFloat(valueStr) : null;
-  } catch {
-    return null;
-  }
+  return valueStr ? parseFloat(valueStr) : null;
 }
 
 /**
@@ -256,7 +337,7 @@ export function isValidTransactionRow(row: any[]): boolean {
 
   // Check if first column contains a date pattern (DD/MM format)
   const firstCellStr = row[0] ? String(row[0]).trim() : "";
-  const datePattern = /\d{1,2}\/\d{1,2}/.test(firstCellStr);
+  const datePattern = RE_DATE_DDMM_START.test(firstCellStr);
 
   // Accept rows that either:
   // 1. Have a date in first column (main transaction row)
@@ -290,26 +371,48 @@ export function mergeTransactionLines(rows: any[][]): any[][] {
   let currentTransaction: any[] | null = null;
   let bufferedAmountsRow: any[] | null = null;
 
+  // Continuation text for KETERANGAN/DETAIL TRANSAKSI is collected in part
+  // lists and joined once per transaction, instead of growing a string with
+  // repeated concatenation (O(n^2) for long multi-line descriptions).
+  let keteranganParts: string[] = [];
+  let detailParts: string[] = [];
+  let keteranganMerged = false;
+  let detailMerged = false;
+
+  const finishTransaction = () => {
+    if (currentTransaction === null) {
+      return;
+    }
+    if (keteranganMerged) {
+      currentTransaction[1] = keteranganParts.join(' ');
+    }
+    if (detailMerged) {
+      currentTransaction[2] = detailParts.join(' ');
+    }
+    mergedRows.push(currentTransaction);
+  };
+
   for (const row of rows) {
     // Defensive padding: ensure row has 5 columns before accessing indices
-    const padded = [...row];
-    while (padded.length < 5) {
-      padded.push('');
-    }
+    const padded = padRow(row);
 
     const tanggal = String(padded[0] || '').trim();
 
     // Check if this row starts with a date (DD/MM format)
-    const hasDate = /\d{1,2}\/\d{1,2}/.test(tanggal);
+    const hasDate = RE_DATE_DDMM_START.test(tanggal);
 
     if (hasDate) {
       // This is a new transaction row
-      if (currentTransaction !== null) {
-        mergedRows.push(currentTransaction);
-      }
+      finishTransaction();
 
       // Start new transaction
       currentTransaction = [...padded];
+      const baseKeterangan = padded[1] ? String(padded[1]).trim() : "";
+      const baseDetail = padded[2] ? String(padded[2]).trim() : "";
+      keteranganParts = baseKeterangan ? [baseKeterangan] : [];
+      detailParts = baseDetail ? [baseDetail] : [];
+      keteranganMerged = false;
+      detailMerged = false;
 
       // Apply buffered amounts-only row (e.g. after page break) if this row is missing them
       if (bufferedAmountsRow && (!currentTransaction[3] || !String(currentTransaction[3]).trim() || !currentTransaction[4] || !String(currentTransaction[4]).trim())) {
@@ -327,15 +430,15 @@ export function mergeTransactionLines(rows: any[][]): any[][] {
         // Merge DETAIL TRANSAKSI column (index 2) - continuation details
         const detailValue = padded[2] ? String(padded[2]).trim() : "";
         if (detailValue) {
-          const currentDetail = currentTransaction[2] ? String(currentTransaction[2]).trim() : "";
-          currentTransaction[2] = currentDetail ? `${currentDetail} ${detailValue}` : detailValue;
+          detailParts.push(detailValue);
+          detailMerged = true;
         }
 
         // Also merge KETERANGAN if it has content (index 1)
         const keteranganValue = padded[1] ? String(padded[1]).trim() : "";
         if (keteranganValue) {
-          const currentKeterangan = currentTransaction[1] ? String(currentTransaction[1]).trim() : "";
-          currentTransaction[1] = currentKeterangan ? `${currentKeterangan} ${keteranganValue}` : keteranganValue;
+          keteranganParts.push(keteranganValue);
+          keteranganMerged = true;
         }
 
         // If MUTASI or SALDO appear in continuation, they might be missing from main row
@@ -360,35 +463,37 @@ export function mergeTransactionLines(rows: any[][]): any[][] {
   }
 
   // Add the last transaction
-  if (currentTransaction !== null) {
-    mergedRows.push(currentTransaction);
-  }
+  finishTransaction();
 
   return mergedRows;
 }
 
 /**
  * Clean transaction data and convert to structured format.
+ *
+ * Pass alreadyMerged=true when the rows come from a source that has run
+ * isValidTransactionRow/mergeTransactionLines itself (extractTablesFromPdf
+ * does); the filter + merge safety net is then skipped instead of
+ * re-scanning every row.
  */
-export function cleanTransactionData(rawRows: any[][]): TransactionRow[] {
+export function cleanTransactionData(rawRows: any[][], alreadyMerged: boolean = false): TransactionRow[] {
   if (!rawRows || rawRows.length === 0) {
     return [];
   }
 
-  // Filter out invalid rows
-  const validRows = rawRows.filter(isValidTransactionRow);
-
-  // Merge multi-line transactions
-  const mergedRows = mergeTransactionLines(validRows);
+  // Filter out invalid rows and merge multi-line transactions, unless the
+  // parser already did both
+  const mergedRows = alreadyMerged
+    ? rawRows
+    : mergeTransactionLines(rawRows.filter(isValidTransactionRow));
 
   // Convert to TransactionRow format
   const cleanedData: TransactionRow[] = mergedRows
     .map((row) => {
-      // Ensure row has at least 5 columns
-      const paddedRow = [...row];
-      while (paddedRow.length < 5) {
-        paddedRow.push(null);
-      }
+      // mergeTransactionLines already returns fresh 5-column rows; only pad
+      // (copying) when a shorter row slipped through. The row is read-only
+      // here, so no defensive copy is needed.
+      const paddedRow = row.length >= COLUMN_COUNT ? row : padRow(row, null);
       return {
         TANGGAL: paddedRow[0] ? String(paddedRow[0]).trim() : "",
         KETERANGAN: paddedRow[1] ? String(paddedRow[1]).trim() : "",
@@ -398,8 +503,9 @@ export function cleanTransactionData(rawRows: any[][]): TransactionRow[] {
       };
     })
     .filter((row) => {
-      // Remove rows where TANGGAL is empty (invalid transactions)
-      return row.TANGGAL && row.TANGGAL.trim() !== "";
+      // Remove rows where TANGGAL is empty (invalid transactions).
+      // TANGGAL was trimmed in the map above, so no re-strip is needed.
+      return row.TANGGAL !== "";
     });
 
   // Post-processing: extract MUTASI/SALDO from DETAIL TRANSAKSI if still missing.
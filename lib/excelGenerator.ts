@@ -1,121 +1,106 @@
 import ExcelJS from 'exceljs';
+import { PassThrough } from 'stream';
+import { getExpectedColumns, insertCategoryColumn } from './dataCleaner';
 import { TransactionRow } from './types';
 
+const DEFAULT_COLUMNS = ['TANGGAL', 'KETERANGAN', 'DETAIL TRANSAKSI', 'MUTASI', 'SALDO', 'CATEGORY'];
+
 /**
- * Generate Excel file from transaction data.
- * 
- * @param data - Array of transaction rows
- * @returns Promise that resolves to Excel file buffer
+ * Determine the output column order for a data set:
+ * TANGGAL, KETERANGAN, DETAIL TRANSAKSI, CATEGORY (if present), MUTASI,
+ * SALDO, then any remaining columns.
  */
-export async function generateExcelFile(data: TransactionRow[]): Promise<Buffer> {
-  const workbook = new ExcelJS.Workbook();
-  const worksheet = workbook.addWorksheet('Transactions');
-
-  if (!data || data.length === 0) {
-    // Create empty worksheet with headers
-    const headers = ['TANGGAL', 'KETERANGAN', 'DETAIL TRANSAKSI', 'MUTASI', 'SALDO', 'CATEGORY'];
-    worksheet.addRow(headers);
-    
-    // Style header row
-    const headerRow = worksheet.getRow(1);
-    headerRow.font = { bold: true };
-    headerRow.fill = {
-      type: 'pattern',
-      pattern: 'solid',
-      fgColor: { argb: 'FF34495E' }
-    };
-    headerRow.font = { ...headerRow.font, color: { argb: 'FFFFFFFF' }, bold: true };
-    
-    const buffer = await workbook.xlsx.writeBuffer();
-    return Buffer.from(buffer);
-  }
-
-  // Get all unique column names from data
+function resolveColumnOrder(data: TransactionRow[]): string[] {
   const allColumns = new Set<string>();
   data.forEach(row => {
     Object.keys(row).forEach(key => allColumns.add(key));
   });
 
-  // Determine column order: TANGGAL, KETERANGAN, DETAIL TRANSAKSI, CATEGORY (if exists), MUTASI, SALDO, then others
-  const preferredOrder = ['TANGGAL', 'KETERANGAN', 'DETAIL TRANSAKSI'];
-  const categoryIndex = preferredOrder.length;
+  const preferredOrder = getExpectedColumns();
   if (allColumns.has('CATEGORY')) {
-    preferredOrder.push('CATEGORY');
+    insertCategoryColumn(preferredOrder);
   }
-  preferredOrder.push('MUTASI', 'SALDO');
-  
+
   const remainingColumns = Array.from(allColumns).filter(
     col => !preferredOrder.includes(col)
   );
-  const columnOrder = [...preferredOrder, ...remainingColumns];
+  return [...preferredOrder, ...remainingColumns];
+}
 
-  // Add header row
-  worksheet.addRow(columnOrder);
+function columnWidth(columnName: string): number {
+  if (columnName === 'TANGGAL') return 12;
+  if (columnName === 'KETERANGAN') return 20;
+  if (columnName === 'DETAIL TRANSAKSI') return 50;
+  if (columnName === 'MUTASI' || columnName === 'SALDO') return 18;
+  return 15;
+}
+
+/**
+ * Generate Excel file from transaction data.
+ *
+ * Uses the streaming workbook writer, which serializes each row as it is
+ * committed instead of holding the whole workbook in memory, so memory use
+ * stays flat regardless of statement size.
+ *
+ * @param data - Array of transaction rows
+ * @returns Promise that resolves to Excel file buffer
+ */
+export async function generateExcelFile(data: TransactionRow[]): Promise<Buffer> {
+  const stream = new PassThrough();
+  const chunks: Buffer[] = [];
+  stream.on('data', chunk => chunks.push(chunk as Buffer));
+  const finished = new Promise<void>((resolve, reject) => {
+    stream.on('end', () => resolve());
+    stream.on('error', reject);
+  });
+
+  const workbook = new ExcelJS.stream.xlsx.WorkbookWriter({ stream, useStyles: true });
+  const worksheet = workbook.addWorksheet('Transactions', {
+    views: [{ state: 'frozen', ySplit: 1 }],
+  });
+
+  const hasData = !!data && data.length > 0;
+  const columnOrder = hasData ? resolveColumnOrder(data) : DEFAULT_COLUMNS;
+
+  // Column widths and number formats must be declared before rows are
+  // committed in streaming mode.
+  worksheet.columns = columnOrder.map(columnName => ({
+    header: columnName,
+    width: columnWidth(columnName),
+    ...(columnName === 'MUTASI' || columnName === 'SALDO'
+      ? { style: { numFmt: '#,##0.00' } }
+      : {}),
+  })) as ExcelJS.Column[];
 
   // Style header row
   const headerRow = worksheet.getRow(1);
-  headerRow.font = { bold: true };
+  headerRow.font = { bold: true, color: { argb: 'FFFFFFFF' } };
   headerRow.fill = {
     type: 'pattern',
     pattern: 'solid',
     fgColor: { argb: 'FF34495E' }
   };
-  headerRow.font = { ...headerRow.font, color: { argb: 'FFFFFFFF' }, bold: true };
-
-  // Add data rows
-  data.forEach((row) => {
-    const rowData = columnOrder.map(col => row[col] ?? '');
-    worksheet.addRow(rowData);
-  });
+  headerRow.commit();
 
-  // Format columns
-  worksheet.columns.forEach((column, index) => {
-    if (!column) return;
-    
-    const columnName = columnOrder[index];
-    
-    // Set column width
-    if (columnName === 'TANGGAL') {
-      column.width = 12;
-    } else if (columnName === 'KETERANGAN') {
-      column.width = 20;
-    } else if (columnName === 'DETAIL TRANSAKSI') {
-      column.width = 50;
-    } else if (columnName === 'CATEGORY') {
-      column.width = 15;
-    } else if (columnName === 'MUTASI' || columnName === 'SALDO') {
-      column.width = 18;
-      // Format as number with 2 decimal places
-      column.numFmt = '#,##0.00';
-    } else {
-      column.width = 15;
-    }
+  if (hasData) {
+    for (const row of data) {
+      const rowData = columnOrder.map(columnName => {
+        const value = row[columnName] ?? '';
 
-    // Format numeric columns
-    if ((columnName === 'MUTASI' || columnName === 'SALDO') && column && column.eachCell) {
-      column.eachCell({ includeEmpty: false }, (cell, rowNumber) => {
-        if (rowNumber > 1 && cell.value !== null && cell.value !== '') {
-          const numValue = typeof cell.value === 'number' 
-            ? cell.value 
-            : parseFloat(String(cell.value));
-          if (!isNaN(numValue)) {
-            cell.value = numValue;
-            cell.numFmt = '#,##0.00';
-          }
+        // Coerce numeric columns so the number format applies
+        if ((columnName === 'MUTASI' || columnName === 'SALDO') && value !== '') {
+          const numValue = typeof value === 'number' ? value : parseFloat(String(value));
+          return isNaN(numValue) ? value : numValue;
         }
+        return value;
       });
+      worksheet.addRow(rowData).commit();
     }
-  });
+  }
 
-  // Freeze header row
-  worksheet.views = [
-    {
-      state: 'frozen',
-      ySplit: 1
-    }
-  ];
+  worksheet.commit();
+  await workbook.commit();
+  await finished;
 
-  // Generate buffer
-  const buffer = await workbook.xlsx.writeBuffer();
-  return Buffer.from(buffer);
+  return Buffer.concat(chunks);
 }
@@ -1,23 +1,35 @@
 import pdfParse from 'pdf-parse';
-import { cleanTransactionData, mergeTransactionLines, isValidTransactionRow, isCurrencyValue, extractCurrencyValues } from './dataCleaner';
+import { getExpectedColumns, mergeTransactionLines, isValidTransactionRow, isCurrencyValue, extractCurrencyValues } from './dataCleaner';
 
-const EXPECTED_COLUMNS = ["TANGGAL", "KETERANGAN", "DETAIL TRANSAKSI", "MUTASI", "SALDO"];
+export { getExpectedColumns };
+
+// Compiled once at module load, like the pattern set in dataCleaner.
+// Unlike the cleaner's DD/MM pattern, dates here may also use a dash
+// separator (raw pdf-parse text is less regular than cleaned cells).
+const RE_DATE_START = /^(\d{1,2}[\/\-]\d{1,2})/;
+const RE_HAS_DIGIT = /\d/;
+const RE_DIGITS_ONLY = /^\d+$/;
+const RE_MULTI_SPACE_SPLIT = /\s{2,}/;
+const RE_TRANSACTION_TYPE = /^([A-Z\s]{2,20}?)(?:\s|$)/;
+// Strict full-line pattern: date, description, then MUTASI and SALDO amounts
+const RE_TRANSACTION_LINE = /^(\d{1,2}[\/\-]\d{1,2}(?:\s+\d{1,2}[\/\-]\d{1,2})?)\s+(.+?)\s+([\d.,\-]+(?:\s*(?:DB|CR))?)\s+([\d.,\-]+(?:\s*(?:DB|CR))?)$/;
 
 /**
  * Extract table data from PDF text using fixed-width column parsing.
  * BCA statements use fixed-width columns that we can parse using character positions.
  */
-function parseTableFromText(text: string): any[][] {
-  const lines = text.split('\n');
+function parseTableFromText(lines: string[]): any[][] {
   const rows: any[][] = [];
   let inTable = false;
   let headerFound = false;
 
   for (let i = 0; i < lines.length; i++) {
     const line = lines[i].trim();
-    
+    // Uppercase once per line; the header/summary checks below share it
+    const lineUpper = line.toUpperCase();
+
     // Look for table header
-    if (!headerFound && line.toUpperCase().includes('TANGGAL') && line.toUpperCase().includes('KETERANGAN')) {
+    if (!headerFound && lineUpper.includes('TANGGAL') && lineUpper.includes('KETERANGAN')) {
       headerFound = true;
       inTable = true;
       continue;
@@ -29,10 +41,10 @@ function parseTableFromText(text: string): any[][] {
     }
 
     // Stop if we hit a page break or summary section
-    if (line.toUpperCase().includes('SALDO AWAL') || 
-        line.toUpperCase().includes('SALDO AKHIR') ||
-        line.toUpperCase().includes('TOTAL') ||
-        (line.length > 0 && !/\d/.test(line) && !line.includes('/'))) {
+    if (lineUpper.includes('SALDO AWAL') ||
+        lineUpper.includes('SALDO AKHIR') ||
+        lineUpper.includes('TOTAL') ||
+        (line.length > 0 && !RE_HAS_DIGIT.test(line) && !line.includes('/'))) {
       // Check if this might still be a transaction line
       if (!isValidTransactionRow(parseFixedWidthLine(line))) {
         continue;
@@ -66,7 +78,7 @@ function parseFixedWidthLine(line: string): any[] {
   }
 
   // Look for date pattern at the start (DD/MM or DD-MM)
-  const dateMatch = line.match(/^(\d{1,2}[\/\-]\d{1,2})/);
+  const dateMatch = line.match(RE_DATE_START);
   
   if (!dateMatch) {
     // Might be a continuation line - check if it has content
@@ -92,14 +104,14 @@ function parseFixedWidthLine(line: string): any[] {
 
   // Split remaining description into KETERANGAN and DETAIL TRANSAKSI
   // Use multiple spaces as delimiter, or take first word/phrase as KETERANGAN
-  const descParts = remainingLine.split(/\s{2,}/); // Split on multiple spaces
+  const descParts = remainingLine.split(RE_MULTI_SPACE_SPLIT); // Split on multiple spaces
   let keterangan = descParts[0] || '';
   let detailTransaksi = descParts.slice(1).join(' ') || '';
 
   // If no multiple-space split, try to identify KETERANGAN as first meaningful phrase
   if (!detailTransaksi && remainingLine.length > 0) {
     // Look for common transaction type patterns at the start
-    const transactionTypeMatch = remainingLine.match(/^([A-Z\s]{2,20}?)(?:\s|$)/);
+    const transactionTypeMatch = remainingLine.match(RE_TRANSACTION_TYPE);
     if (transactionTypeMatch) {
       keterangan = transactionTypeMatch[1].trim();
       detailTransaksi = remainingLine.substring(keterangan.length).trim();
@@ -126,10 +138,9 @@ function parseFixedWidthLine(line: string): any[] {
 /**
  * Alternative parsing method: Use regex to extract structured data
  */
-function parseTableWithRegex(text: string): any[][] {
+function parseTableWithRegex(lines: string[]): any[][] {
   const rows: any[][] = [];
-  const lines = text.split('\n');
-  
+
   let inTable = false;
   let headerFound = false;
 
@@ -149,8 +160,7 @@ function parseTableWithRegex(text: string): any[][] {
 
     // Try to parse using the improved parseFixedWidthLine function first
     // This handles currency extraction better
-    const simpleDatePattern = /^(\d{1,2}[\/\-]\d{1,2})/;
-    if (simpleDatePattern.test(trimmed)) {
+    if (RE_DATE_START.test(trimmed)) {
       const parsed = parseFixedWidthLine(trimmed);
       if (parsed && parsed.length >= 3) {
         rows.push(parsed);
@@ -159,11 +169,8 @@ function parseTableWithRegex(text: string): any[][] {
     }
 
     // Fallback: Try strict pattern matching for well-formatted lines
-    // Pattern for transaction line: date followed by description and amounts
     // Format: DD/MM description... amount amount
-    const transactionPattern = /^(\d{1,2}[\/\-]\d{1,2}(?:\s+\d{1,2}[\/\-]\d{1,2})?)\s+(.+?)\s+([\d.,\-]+(?:\s*(?:DB|CR))?)\s+([\d.,\-]+(?:\s*(?:DB|CR))?)$/;
-    
-    const match = trimmed.match(transactionPattern);
+    const match = trimmed.match(RE_TRANSACTION_LINE);
     
     if (match) {
       const [, date, description, mutasi, saldo] = match;
@@ -171,7 +178,7 @@ function parseTableWithRegex(text: string): any[][] {
       // Validate that mutasi and saldo look like currency values
       if (isCurrencyValue(mutasi) && isCurrencyValue(saldo)) {
         // Split description into KETERANGAN and DETAIL TRANSAKSI (approximate)
-        const descParts = description.split(/\s{2,}/);
+        const descParts = description.split(RE_MULTI_SPACE_SPLIT);
         const keterangan = descParts[0] || '';
         const detailTransaksi = descParts.slice(1).join(' ') || description.substring(keterangan.length).trim();
         
@@ -183,7 +190,7 @@ function parseTableWithRegex(text: string): any[][] {
           rows.push(parsed);
         }
       }
-    } else if (trimmed.length > 0 && !/^\d+$/.test(trimmed)) {
+    } else if (trimmed.length > 0 && !RE_DIGITS_ONLY.test(trimmed)) {
       // Might be a continuation line - try to extract currency values
       const { mutasi, saldo, remainingLine } = extractCurrencyValues(trimmed);
       if (mutasi || saldo) {
@@ -209,12 +216,15 @@ export async function extractTablesFromPdf(pdfBuffer: Buffer): Promise<any[][]>
       throw new Error("PDF contains no extractable text");
     }
 
+    // Split into lines once; both parsing strategies share the array
+    const lines = text.split('\n');
+
     // Try regex-based parsing first
-    let rows = parseTableWithRegex(text);
-    
+    let rows = parseTableWithRegex(lines);
+
     // If that doesn't work well, try fixed-width parsing
     if (rows.length === 0) {
-      rows = parseTableFromText(text);
+      rows = parseTableFromText(lines);
     }
 
     // Filter out invalid rows
@@ -228,10 +238,3 @@ export async function extractTablesFromPdf(pdfBuffer: Buffer): Promise<any[][]>
     throw new Error(`Error reading PDF: ${error instanceof Error ? error.message : String(error)}`);
   }
 }
-
-/**
- * Get the expected column names for bank transaction tables.
- */
-export function getExpectedColumns(): string[] {
-  return [...EXPECTED_COLUMNS];
-}
@@ -0,0 +1,103 @@
+import { createHash } from 'crypto';
+import { extractTablesFromPdf } from './pdfParser';
+import { cleanTransactionData } from './dataCleaner';
+import { applyCategoriesToData } from './categoryMapper';
+import { hashCategories } from './resultCache';
+import { Category, TransactionRow } from './types';
+
+/**
+ * Core PDF-to-transactions pipeline: extract -> clean -> categorize.
+ * Route handlers stay thin and every pipeline optimization lands here once.
+ */
+
+/** Raised when a PDF yields no usable transaction data (a user-facing error). */
+export class PdfPipelineError extends Error {}
+
+// Cleaned extraction results keyed by sha256 of the PDF bytes. Re-uploading
+// the same statement (common when the user tweaks categories) skips the
+// expensive extract + clean steps; categorization stays outside the cache
+// since categories change independently of the PDF.
+const EXTRACTION_CACHE_SIZE = 20;
+const extractionCache = new Map<string, TransactionRow[]>();
+
+/**
+ * Extract and clean transaction rows from a PDF, caching results by content
+ * hash. Throws PdfPipelineError when the PDF contains no usable table.
+ */
+export async function extractAndCleanPdf(pdfBuffer: Buffer): Promise<TransactionRow[]> {
+  const contentHash = createHash('sha256').update(pdfBuffer).digest('hex');
+
+  const cached = extractionCache.get(contentHash);
+  if (cached) {
+    // Re-insert to refresh LRU order (Maps iterate in insertion order)
+    extractionCache.delete(contentHash);
+    extractionCache.set(contentHash, cached);
+    // Return fresh row objects: callers mutate rows in place (CATEGORY),
+    // and the cached extraction must stay uncategorized and unshared.
+    return cached.map(row => ({ ...row }));
+  }
+
+  const rawRows = await extractTablesFromPdf(pdfBuffer);
+
+  // Debug: log first few raw rows to help diagnose parsing issues
+  console.log('[PDF Parser] Raw rows extracted:', rawRows.length);
+  rawRows.slice(0, 5).forEach((row, i) => {
+    console.log(`[PDF Parser] Row ${i}:`, JSON.stringify(row));
+  });
+
+  if (!rawRows || rawRows.length === 0) {
+    throw new PdfPipelineError(
+      'No transaction tables found in the PDF. Please verify the file format.'
+    );
+  }
+
+  // extractTablesFromPdf already filtered and merged multi-line rows
+  const cleanedData = cleanTransactionData(rawRows, true);
+
+  // Debug: log first few cleaned rows
+  console.log('[PDF Parser] Cleaned rows:', cleanedData.length);
+  cleanedData.slice(0, 5).forEach((row, i) => {
+    console.log(`[PDF Parser] Cleaned ${i}:`, JSON.stringify({
+      TANGGAL: row.TANGGAL,
+      KETERANGAN: row.KETERANGAN,
+      DETAIL: row["DETAIL TRANSAKSI"]?.substring(0, 50),
+      MUTASI: row.MUTASI,
+      SALDO: row.SALDO,
+    }));
+  });
+
+  if (cleanedData.length === 0) {
+    throw new PdfPipelineError(
+      'No valid transaction data found after cleaning. Please verify the PDF format.'
+    );
+  }
+
+  if (extractionCache.size >= EXTRACTION_CACHE_SIZE) {
+    extractionCache.delete(extractionCache.keys().next().value as string);
+  }
+  // Store a private copy of the rows; the returned array is categorized
+  // in place by processPdf and must not alias the cache entry.
+  extractionCache.set(contentHash, cleanedData.map(row => ({ ...row })));
+
+  return cleanedData;
+}
+
+/**
+ * Run the full pipeline on a PDF: extract, clean and (when a config is
+ * given) categorize. Returns the rows plus the hash of the applied
+ * category config, which lets the download path skip re-categorization.
+ */
+export async function processPdf(
+  pdfBuffer: Buffer,
+  categories: Category[] | null
+): Promise<{ data: TransactionRow[]; categoriesHash: string | null }> {
+  const data = await extractAndCleanPdf(pdfBuffer);
+
+  let categoriesHash: string | null = null;
+  if (categories) {
+    applyCategoriesToData(data, categories);
+    categoriesHash = hashCategories(categories);
+  }
+
+  return { data, categoriesHash };
+}
@@ -0,0 +1,84 @@
+import { createHash, randomUUID } from 'crypto';
+import { Category, TransactionRow } from './types';
+
+/**
+ * In-memory cache of cleaned transaction data, keyed by an opaque token
+ * returned to the client at upload time. Lets the download endpoint reuse
+ * the server-side result instead of parsing the full row set out of the
+ * request body again.
+ *
+ * Entries expire after an hour and the cache is bounded, so a long-running
+ * server doesn't accumulate statements indefinitely.
+ */
+
+const CACHE_TTL_MS = 60 * 60 * 1000;
+const MAX_ENTRIES = 100;
+
+export interface CachedResult {
+  data: TransactionRow[];
+  /** Hash of the category config applied at upload time, if any. */
+  categoriesHash: string | null;
+}
+
+interface CacheEntry extends CachedResult {
+  expiresAt: number;
+}
+
+const entries = new Map<string, CacheEntry>();
+
+/**
+ * Hash a category config so upload and download can tell whether the same
+ * categories were applied. Categorization is deterministic given
+ * (descriptions, categories), so matching hashes mean the cached CATEGORY
+ * column is still valid.
+ */
+export function hashCategories(categories: Category[]): string {
+  return createHash('sha256').update(JSON.stringify(categories)).digest('hex');
+}
+
+function pruneExpired(): void {
+  const now = Date.now();
+  for (const [token, entry] of entries) {
+    if (entry.expiresAt <= now) {
+      entries.delete(token);
+    }
+  }
+}
+
+/**
+ * Store cleaned transaction data and return the token identifying it.
+ */
+export function storeTransactionData(
+  data: TransactionRow[],
+  categoriesHash: string | null = null
+): string {
+  pruneExpired();
+
+  // Evict the oldest entry when full (Maps iterate in insertion order)
+  if (entries.size >= MAX_ENTRIES) {
+    entries.delete(entries.keys().next().value as string);
+  }
+
+  const token = randomUUID();
+  entries.set(token, { data, categoriesHash, expiresAt: Date.now() + CACHE_TTL_MS });
+  return token;
+}
+
+/**
+ * Look up transaction data by token. Returns null if the token is unknown
+ * or the entry has expired (e.g. after a server restart).
+ */
+export function getTransactionData(token: string): CachedResult | null {
+  const entry = entries.get(token);
+
+  if (!entry) {
+    return null;
+  }
+
+  if (entry.expiresAt <= Date.now()) {
+    entries.delete(token);
+    return null;
+  }
+
+  return { data: entry.data, categoriesHash: entry.categoriesHash };
+}
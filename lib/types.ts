@@ -26,6 +26,7 @@ export interface PreviewData {
 
 export interface UploadResponse {
   error?: string;
+  data_token?: string;
   total_rows?: number;
   columns?: string[];
   preview?: TransactionRow[];